@@ -193,6 +193,10 @@ class ClickCompleter(Completer):
         choices = []
         param_called = False
 
+        # Trailing args that could be values of an option, by the option's nargs.
+        # Most options share the same nargs, so each slice is built only once.
+        current_args_by_nargs = {}
+
         for param in ctx_command.params:
             if isinstance(param.type, click.types.UnprocessedParamType):
                 return []
@@ -202,12 +206,19 @@ class ClickCompleter(Completer):
 
             elif isinstance(param, click.Option):
                 opts = param.opts + param.secondary_opts
-                previous_args = args[: param.nargs * -1]
-                current_args = args[param.nargs * -1 :]
 
-                # Show only unused opts
-                already_present = any([opt in previous_args for opt in opts])
-                hide = self.show_only_unused and already_present and not param.multiple
+                current_args = current_args_by_nargs.get(param.nargs)
+                if current_args is None:
+                    current_args = args[param.nargs * -1 :]
+                    current_args_by_nargs[param.nargs] = current_args
+
+                # Show only unused opts. The set of opts is built only when
+                # this check applies, and not for every option on each keystroke.
+                hide = (
+                    self.show_only_unused
+                    and not param.multiple
+                    and not frozenset(opts).isdisjoint(args[: param.nargs * -1])
+                )
 
                 # Show only shortest opt
                 if (
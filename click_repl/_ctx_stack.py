@@ -7,8 +7,13 @@ if TYPE_CHECKING:
 
 
 # To store the ReplContext objects generated throughout the Runtime.
+# A plain list is used, as the stack only grows as deep as the nested REPLs.
 _context_stack: list[ReplContext] = []
 
+# The ReplContext object at the top of the stack, if any. It's kept in sync
+# with the stack, to read the current context without indexing the stack.
+_current_ctx: ReplContext | None = None
+
 
 def _push_context(ctx: ReplContext) -> None:
     """
@@ -20,9 +25,17 @@ def _push_context(ctx: ReplContext) -> None:
         The :class:`~click_repl.core.ReplContext` object that should be
         added to the REPL context stack.
     """
+    global _current_ctx
+
     _context_stack.append(ctx)
+    _current_ctx = ctx
 
 
 def _pop_context() -> None:
     """Removes the top-level REPL context from the stack."""
-    _context_stack.pop()
+    global _current_ctx
+
+    if _context_stack:
+        _context_stack.pop()
+
+    _current_ctx = _context_stack[-1] if _context_stack else None
@@ -8,8 +8,8 @@ from ._completer import ClickCompleter
 from .exceptions import ClickExit  # type: ignore[attr-defined]
 from .exceptions import CommandLineParserError, ExitReplException, InvalidGroupFormat
 from .utils import _execute_internal_and_sys_cmds
-from .core import ReplContext
-from .globals_ import ISATTY, get_current_repl_ctx
+from .core import DEFAULT_MAX_HISTORY, ReplContext
+from .globals_ import get_current_repl_ctx, isatty
 
 
 __all__ = ["bootstrap_prompt", "register_repl", "repl"]
@@ -37,8 +37,32 @@ def bootstrap_prompt(
     return defaults
 
 
+def _get_command_tty(repl_ctx):
+    """
+    Prompt the user for input using the REPL's PromptSession.
+
+    :param repl_ctx: The current REPL context.
+    """
+    return repl_ctx.session.prompt()
+
+
+def _get_command_pipe(repl_ctx):
+    """
+    Read the input from stdin directly, when it's not a TTY.
+
+    :param repl_ctx: The current REPL context.
+    """
+    inp = sys.stdin.readline().strip()
+    repl_ctx._history.append(inp)
+    return inp
+
+
 def repl(
-    old_ctx, prompt_kwargs={}, allow_system_commands=True, allow_internal_commands=True
+    old_ctx,
+    prompt_kwargs=None,
+    allow_system_commands=True,
+    allow_internal_commands=True,
+    max_history=DEFAULT_MAX_HISTORY,
 ):
     """
     Start an interactive shell. All subcommands are available in it.
@@ -46,6 +70,10 @@ def repl(
     :param old_ctx: The current Click context.
     :param prompt_kwargs: Parameters passed to
         :py:func:`prompt_toolkit.PromptSession`.
+    :param max_history: Maximum number of commands remembered when stdin
+        is not a TTY, ``DEFAULT_MAX_HISTORY`` (5000) by default. Older
+        commands are dropped once it's reached. ``None`` keeps all of them,
+        as in previous versions.
 
     If stdin is not a TTY, no prompt will be printed, but only commands read
     from stdin.
@@ -91,33 +119,25 @@ def repl(
 
     repl_ctx = ReplContext(
         group_ctx,
-        bootstrap_prompt(group, prompt_kwargs, group_ctx),
+        bootstrap_prompt(group, prompt_kwargs or {}, group_ctx),
         get_current_repl_ctx(silent=True),
+        max_history,
     )
 
-    if ISATTY:
-        # If stdin is a TTY, prompt the user for input using PromptSession.
-        def get_command() -> str:
-            return repl_ctx.session.prompt()  # type: ignore
-
-    else:
-        # If stdin is not a TTY, read input from stdin directly.
-        def get_command() -> str:
-            inp = sys.stdin.readline().strip()
-            repl_ctx._history.append(inp)
-            return inp
+    is_tty = isatty()
+    get_command = _get_command_tty if is_tty else _get_command_pipe
 
     with repl_ctx:
         while True:
             try:
-                command = get_command()
+                command = get_command(repl_ctx)
             except KeyboardInterrupt:
                 continue
             except EOFError:
                 break
 
             if not command:
-                if ISATTY:
+                if is_tty:
                     continue
                 else:
                     break
@@ -155,6 +175,16 @@ def repl(
         available_commands[repl_command_name] = original_command
 
 
+# Callback of the REPL command, shared across every group it's registered in.
+_repl_command_callback = click.pass_context(repl)
+
+
 def register_repl(group, name="repl"):
     """Register :func:`repl()` as sub-command *name* of *group*."""
-    group.command(name=name)(click.pass_context(repl))
+
+    # Nothing to do if the REPL is already registered under this name.
+    command = group.commands.get(name)
+    if command is not None and command.callback is _repl_command_callback:
+        return
+
+    group.command(name=name)(_repl_command_callback)
@@ -4,15 +4,18 @@ Core functionalities for managing context of the click_repl app.
 
 from __future__ import annotations
 
+from collections import deque
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, TypeVar
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterator, TypeVar
 
 from click import Context
 from prompt_toolkit import PromptSession
 from typing_extensions import Concatenate, Final, ParamSpec, TypeAlias, TypedDict
 
+from . import _ctx_stack
 from ._ctx_stack import _pop_context, _push_context
-from .globals_ import ISATTY, get_current_repl_ctx
+from .globals_ import get_current_repl_ctx, isatty
 
 if TYPE_CHECKING:
     from prompt_toolkit.formatted_text import AnyFormattedText
@@ -23,18 +26,21 @@ R = TypeVar("R")
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-__all__ = ["ReplContext", "pass_context"]
+__all__ = ["DEFAULT_MAX_HISTORY", "ReplContext", "pass_context"]
 
 
 _PromptSession: TypeAlias = PromptSession[Dict[str, Any]]
 
+DEFAULT_MAX_HISTORY: Final = 5000
+"""Default number of commands kept in the history, when stdin is not a TTY."""
+
 
 class ReplContextInfoDict(TypedDict):
     group_ctx: Context
     prompt_kwargs: dict[str, Any]
     session: _PromptSession | None
     parent: ReplContext | None
-    _history: list[str]
+    _history: deque[str]
 
 
 class ReplContext:
@@ -61,47 +67,45 @@ class ReplContext:
 
     parent
         REPL Context object of the parent REPL session, if exists. Otherwise, :obj:`None`.
+
+    max_history
+        Maximum number of commands kept in the history when :func:`~sys.stdin.isatty`
+        is :obj:`False`. Defaults to :data:`~.DEFAULT_MAX_HISTORY`. Pass :obj:`None`
+        to keep all of them.
     """
 
     __slots__ = (
         "group_ctx",
         "prompt_kwargs",
         "parent",
-        "session",
+        "_session",
         "_history",
     )
 
     def __init__(
         self,
         group_ctx: Context,
-        prompt_kwargs: dict[str, Any] = {},
+        prompt_kwargs: dict[str, Any] | None = None,
         parent: ReplContext | None = None,
+        max_history: int | None = DEFAULT_MAX_HISTORY,
     ) -> None:
         """
         Initializes the `ReplContext` class.
         """
-        session: _PromptSession | None
-
-        if ISATTY:
-            session = PromptSession(**prompt_kwargs)
-
-        else:
-            session = None
-
         self.group_ctx: Final[Context] = group_ctx
         """The click context object that belong to the CLI/parent Group."""
 
-        self.session = session
-        """Object that's responsible for managing and executing the REPL."""
+        # PromptSession object of the REPL, created on its first access.
+        self._session: _PromptSession | None = None
 
-        self._history: list[str] = []
+        self._history: deque[str] = deque(maxlen=max_history)
         """
-        History of past executed commands.
+        History of past executed commands, bounded to ``max_history`` items.
 
         Used only when :func:`~sys.stdin.isatty` is :obj:`False`.
         """
 
-        self.prompt_kwargs = prompt_kwargs
+        self.prompt_kwargs = {} if prompt_kwargs is None else prompt_kwargs
         """
         Extra keyword arguments for
         :class:`~prompt_toolkit.shortcuts.PromptSession` class.
@@ -120,6 +124,28 @@ class ReplContext:
     def __exit__(self, *_: Any) -> None:
         _pop_context()
 
+    @property
+    def session(self) -> _PromptSession | None:
+        """
+        Object that's responsible for managing and executing the REPL.
+
+        It's created only when it's accessed for the first time, as building a
+        :class:`~prompt_toolkit.shortcuts.PromptSession` is expensive.
+
+        Returns
+        -------
+        prompt_toolkit.shortcuts.PromptSession | None
+            The session object if :func:`~sys.stdin.isatty` is :obj:`True`,
+            else :obj:`None`.
+        """
+        if isatty() and self._session is None:
+            self._session = PromptSession(**self.prompt_kwargs)
+        return self._session
+
+    @session.setter
+    def session(self, value: _PromptSession | None) -> None:
+        self._session = value
+
     @property
     def prompt(self) -> AnyFormattedText:
         """
@@ -131,19 +157,22 @@ class ReplContext:
             The prompt object if :func:`~sys.stdin.isatty` is :obj:`True`,
             else :obj:`None`.
         """
-        if ISATTY and self.session is not None:
-            return self.session.message
-        return None
+        # The session property is read only once, as it's not a plain attribute.
+        session = self.session if isatty() else None
+        return session.message if session is not None else None
 
     @prompt.setter
     def prompt(self, value: AnyFormattedText) -> None:
-        if ISATTY and self.session is not None:
-            self.session.message = value
+        session = self.session if isatty() else None
+        if session is not None:
+            session.message = value
 
     def to_info_dict(self) -> ReplContextInfoDict:
         """
         Provides a dictionary with minimal info about the current REPL.
 
+        It doesn't create the :attr:`~.session` if it's not created yet.
+
         Returns
         -------
         ReplContextInfoDict
@@ -153,7 +182,7 @@ class ReplContext:
         res: ReplContextInfoDict = {
             "group_ctx": self.group_ctx,
             "prompt_kwargs": self.prompt_kwargs,
-            "session": self.session,
+            "session": self._session,
             "parent": self.parent,
             "_history": self._history,
         }
@@ -167,8 +196,25 @@ class ReplContext:
         :class:`~prompt_toolkit.session.PromptSession` object.
         """
 
-        if ISATTY and self.session is not None:
-            self.session = PromptSession(**self.prompt_kwargs)
+        # A new session will be created from the prompt_kwargs on its next access.
+        self._session = None
+
+    def _history_iter(self) -> Iterator[str]:
+        # Iterator over the history strings, from most recent to oldest.
+        if isatty() and self.session is not None:
+            history = self.session.history
+
+            # The session has already loaded the strings into the history's own
+            # cache, so they're read from it, instead of re-reading its storage.
+            # A copy is iterated, as new strings are inserted at its front.
+            if history._loaded:
+                return iter(history._loaded_strings[:])
+
+            return iter(history.load_history_strings())
+
+        # _history must stay a deque: its reverse iterator walks the
+        # blocks directly, without copying or index arithmetic.
+        return reversed(self._history)
 
     def history(self) -> Generator[str, None, None]:
         """
@@ -181,11 +227,40 @@ class ReplContext:
             in chronological order from most recent to oldest.
         """
 
-        if ISATTY and self.session is not None:
-            yield from self.session.history.load_history_strings()
+        yield from self._history_iter()
+
+    def history_batch(self, n: int = 256) -> Iterator[list[str]]:
+        """
+        Generates the history of past executed commands in chunks of ``n`` items.
+
+        Useful for callers that consume the whole history at once, like
+        searching or exporting it.
+
+        Parameters
+        ----------
+        n
+            Maximum number of commands in each chunk. Must be at least 1.
+
+        Returns
+        -------
+        Iterator[list[str]]
+            Iterator of lists of executed command strings from the history,
+            in chronological order from most recent to oldest.
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is less than 1.
+        """
+
+        if n < 1:
+            raise ValueError(f"Batch size must be at least 1, but got {n}")
 
-        else:
-            yield from reversed(self._history)
+        # Slice the underlying iterator directly, rather than the history()
+        # generator, to avoid resuming a generator frame for every item.
+        # Iteration stops once an empty chunk is sliced from it.
+        history = self._history_iter()
+        return iter(lambda: list(islice(history, n)), [])
 
 
 def pass_context(
@@ -209,6 +284,12 @@ def pass_context(
 
     @wraps(func)
     def decorator(*args: P.args, **kwargs: P.kwargs) -> R:
-        return func(get_current_repl_ctx(), *args, **kwargs)
+        # Read the top of the context stack directly, and fall back to
+        # get_current_repl_ctx() only to raise its error when there's none.
+        repl_ctx = _ctx_stack._current_ctx
+        if repl_ctx is None:
+            repl_ctx = get_current_repl_ctx()
+
+        return func(repl_ctx, *args, **kwargs)
 
     return decorator
@@ -1,15 +1,43 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING, NoReturn
+from typing import TYPE_CHECKING, Any, NoReturn
 
-from ._ctx_stack import _context_stack
+from . import _ctx_stack
 
 if TYPE_CHECKING:
     from .core import ReplContext
 
 
-ISATTY = sys.stdin.isatty()
+_isatty: bool | None = None
+
+
+def isatty() -> bool:
+    """
+    Checks whether the standard input is a TTY.
+
+    The result is computed on the first call and cached afterwards, as
+    a process's stdin doesn't change from being a TTY during its runtime.
+
+    Returns
+    -------
+    bool
+        :obj:`True` if :func:`~sys.stdin.isatty` is :obj:`True`, else :obj:`False`.
+    """
+    global _isatty
+
+    if _isatty is None:
+        _isatty = sys.stdin.isatty()
+
+    return _isatty
+
+
+def __getattr__(name: str) -> Any:
+    # Kept for backwards compatibility. ISATTY is evaluated only when accessed.
+    if name == "ISATTY":
+        return isatty()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_current_repl_ctx(silent: bool = False) -> ReplContext | NoReturn | None:
@@ -37,10 +65,9 @@ def get_current_repl_ctx(silent: bool = False) -> ReplContext | NoReturn | None:
         If there's no context object in the stack and ``silent`` is :obj:`False`.
     """
 
-    try:
-        return _context_stack[-1]
-    except IndexError:
-        if not silent:
-            raise RuntimeError("There is no active click-repl context.")
+    ctx = _ctx_stack._current_ctx
+
+    if ctx is None and not silent:
+        raise RuntimeError("There is no active click-repl context.")
 
-    return None
+    return ctx
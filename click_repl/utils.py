@@ -1,8 +1,7 @@
 import click
 import os
-import shlex
 import sys
-from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
 
 from .exceptions import CommandLineParserError, ExitReplException
 
@@ -75,7 +74,22 @@ def _resolve_context(args, ctx=None):
     return ctx
 
 
-_internal_commands = {}
+# Callbacks and descriptions of the internal commands, keyed by their names.
+# They're kept apart, so that dispatching a command needs only one dict lookup.
+_internal_commands: Dict[str, Callable[[], Any]] = {}
+_internal_command_descriptions: Dict[str, Optional[str]] = {}
+
+# Names of the internal commands, grouped by their description. Kept in sync
+# with _internal_commands, to avoid regrouping them on every :help call.
+_internal_commands_by_description: Dict[Optional[str], List[str]] = {}
+
+# Rendered text of the :help command, along with the width it was rendered for.
+# It's reset whenever a new internal command is registered.
+_help_text_cache = None
+
+# Characters recognised by split_arg_string(), same as the shlex defaults.
+_WHITESPACE = " \t\r\n"
+_QUOTES = "'\""
 
 
 def split_arg_string(string, posix=True):
@@ -88,26 +102,88 @@ def split_arg_string(string, posix=True):
         split_arg_string("example my\\")
         ["example", "my"]
     :param string: String to split.
+    :param posix: Split in POSIX mode, like :class:`shlex.shlex`. Otherwise,
+        quotes are kept in the tokens and backslashes aren't escapes.
     """
 
-    lex = shlex.shlex(string, posix=posix)
-    lex.whitespace_split = True
-    lex.commenters = ""
+    # This is a hand-written equivalent of a shlex.shlex lexer with
+    # whitespace_split=True and no commenters, which reads the string one
+    # character at a time through a StringIO and is slow for every keystroke.
+
     out = []
+    token = ""
+    # Whether a token has been started. It can be empty, like in "''".
+    in_token = False
+    quote = None
+    i = 0
+    n = len(string)
+
+    while i < n:
+        char = string[i]
+
+        if quote is not None:
+            if char == quote:
+                quote = None
+
+                if not posix:
+                    # Closing quote ends the token in non-POSIX mode.
+                    out.append(token + char)
+                    token = ""
+                    in_token = False
+
+            elif posix and char == "\\" and quote == '"':
+                i += 1
+                if i == n:
+                    break
+
+                # Only the quote or the escape character itself can be
+                # escaped within double quotes.
+                if string[i] not in '\\"':
+                    token += char
+
+                token += string[i]
 
-    try:
-        for token in lex:
-            out.append(token)
-    except ValueError:
-        # Raised when end-of-string is reached in an invalid state. Use
-        # the partial token as-is. The quote or escape character is in
-        # lex.state, not lex.token.
-        out.append(lex.token)
+            else:
+                token += char
+
+        elif char in _WHITESPACE:
+            if in_token:
+                out.append(token)
+                token = ""
+                in_token = False
+
+        elif posix and char == "\\":
+            in_token = True
+            i += 1
+            if i == n:
+                break
+
+            token += string[i]
+
+        elif char in _QUOTES and (posix or not in_token):
+            quote = char
+            in_token = True
+
+            if not posix:
+                token = char
+
+        else:
+            token += char
+            in_token = True
+
+        i += 1
+
+    # If end-of-string is reached within quotes or an escape sequence,
+    # the partial token is used as-is.
+    if in_token:
+        out.append(token)
 
     return out
 
 
 def _register_internal_command(names, target, description=None):
+    global _help_text_cache
+
     if not hasattr(target, "__call__"):
         raise ValueError("Internal command must be a callable")
 
@@ -122,14 +198,22 @@ def _register_internal_command(names, target, description=None):
         )
 
     for name in names:
-        _internal_commands[name] = (target, description)
+        if name in _internal_command_descriptions:
+            old_description = _internal_command_descriptions[name]
+            old_names = _internal_commands_by_description[old_description]
+            old_names.remove(name)
+            if not old_names:
+                del _internal_commands_by_description[old_description]
+
+        _internal_commands[name] = target
+        _internal_command_descriptions[name] = description
+        _internal_commands_by_description.setdefault(description, []).append(name)
+
+    _help_text_cache = None
 
 
 def _get_registered_target(name, default=None):
-    target_info = _internal_commands.get(name)
-    if target_info:
-        return target_info[0]
-    return default
+    return _internal_commands.get(name, default)
 
 
 def _exit_internal():
@@ -137,7 +221,15 @@ def _exit_internal():
 
 
 def _help_internal():
+    global _help_text_cache
+
     formatter = click.HelpFormatter()
+
+    # The help text depends on the terminal width, so it's rendered again
+    # only if the terminal has been resized since the last call.
+    if _help_text_cache is not None and _help_text_cache[0] == formatter.width:
+        return _help_text_cache[1]
+
     formatter.write_heading("REPL help")
     formatter.indent()
 
@@ -146,20 +238,17 @@ def _help_internal():
 
     with formatter.section("Internal Commands"):
         formatter.write_text('prefix internal commands with ":"')
-        info_table = defaultdict(list)
-
-        for mnemonic, target_info in _internal_commands.items():
-            info_table[target_info[1]].append(mnemonic)
 
         formatter.write_dl(  # type: ignore[arg-type]
             (  # type: ignore[arg-type]
                 ", ".join(map(":{}".format, sorted(mnemonics))),
                 description,
             )
-            for description, mnemonics in info_table.items()
+            for description, mnemonics in _internal_commands_by_description.items()
         )
 
     val = formatter.getvalue()  # type: str
+    _help_text_cache = (formatter.width, val)
     return val
 
 
@@ -177,15 +266,17 @@ def _execute_internal_and_sys_cmds(
     """
     Executes internal, system, and all the other registered click commands from the input
     """
-    if allow_system_commands and dispatch_repl_commands(command):
-        return None
-
-    if allow_internal_commands:
-        result = handle_internal_commands(command)
-        if isinstance(result, str):
-            click.echo(result)
+    # Most of the lines are click commands, so they're rejected in one check.
+    if command.startswith(("!", ":")):
+        if allow_system_commands and dispatch_repl_commands(command):
             return None
 
+        if allow_internal_commands:
+            result = handle_internal_commands(command)
+            if isinstance(result, str):
+                click.echo(result)
+                return None
+
     try:
         return split_arg_string(command)
     except ValueError as e:
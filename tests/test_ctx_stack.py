@@ -0,0 +1,38 @@
+import click
+import pytest
+
+from click_repl.core import ReplContext, pass_context
+from click_repl.globals_ import get_current_repl_ctx
+
+
+def test_no_active_repl_ctx():
+    assert get_current_repl_ctx(silent=True) is None
+
+    with pytest.raises(RuntimeError):
+        get_current_repl_ctx()
+
+
+def test_nested_repl_ctx():
+    group_ctx = click.Context(click.Group("cli"))
+
+    with ReplContext(group_ctx) as outer:
+        assert get_current_repl_ctx() is outer
+
+        with ReplContext(group_ctx, parent=outer) as inner:
+            assert get_current_repl_ctx() is inner
+
+        assert get_current_repl_ctx() is outer
+
+    assert get_current_repl_ctx(silent=True) is None
+
+
+def test_pass_context_without_repl_ctx():
+    @pass_context
+    def callback(repl_ctx):
+        return repl_ctx
+
+    with pytest.raises(RuntimeError):
+        callback()
+
+    with ReplContext(click.Context(click.Group("cli"))) as repl_ctx:
+        assert callback() is repl_ctx
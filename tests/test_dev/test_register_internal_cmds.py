@@ -18,3 +18,37 @@ def test_register_cmd_from_str():
 def test_register_func_xfails(test_input):
     with pytest.raises(ValueError):
         click_repl.utils._register_internal_command(*test_input)
+
+
+def test_reregister_cmd_updates_descriptions():
+    utils = click_repl.utils
+
+    utils._register_internal_command("tmp", utils._exit_internal, "first description")
+    utils._register_internal_command("tmp", utils._exit_internal, "second description")
+
+    try:
+        assert "first description" not in utils._internal_commands_by_description
+        assert utils._internal_commands_by_description["second description"] == [
+            "tmp"
+        ]
+    finally:
+        del utils._internal_commands["tmp"]
+        del utils._internal_command_descriptions["tmp"]
+        del utils._internal_commands_by_description["second description"]
+
+
+def test_register_cmd_updates_help_text():
+    utils = click_repl.utils
+
+    assert ":tmp2" not in utils._help_internal()
+    assert utils._help_internal() is utils._help_internal()
+
+    utils._register_internal_command("tmp2", utils._exit_internal, "tmp2 description")
+
+    try:
+        assert ":tmp2" in utils._help_internal()
+    finally:
+        del utils._internal_commands["tmp2"]
+        del utils._internal_command_descriptions["tmp2"]
+        del utils._internal_commands_by_description["tmp2 description"]
+        utils._help_text_cache = None
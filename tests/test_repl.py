@@ -162,3 +162,18 @@ def test_inputs(capsys):
 
     captured_stdout = capsys.readouterr().out.replace("\r\n", "\n")
     assert captured_stdout == ""
+
+
+def test_register_repl_twice():
+    @click.group()
+    def cli():
+        pass
+
+    click_repl.register_repl(cli)
+    repl_command = cli.commands["repl"]
+
+    click_repl.register_repl(cli)
+    assert cli.commands["repl"] is repl_command
+
+    click_repl.register_repl(cli, name="shell")
+    assert cli.commands["shell"] is not repl_command
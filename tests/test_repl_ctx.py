@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+
 import click
 import pytest
+from prompt_toolkit.history import InMemoryHistory
+from prompt_toolkit.output import DummyOutput
 
 import click_repl
+from click_repl.core import ReplContext
 from tests import mock_stdin
 
 
@@ -36,6 +41,30 @@ def test_repl_ctx_history(capsys):
     )
 
 
+@cli.command()
+@click_repl.pass_context
+def history_batch_test(repl_ctx):
+    print(list(repl_ctx.history_batch(2)))
+
+
+def test_repl_ctx_history_batch(capsys):
+    with mock_stdin("hello\nhello\nhistory-batch-test\n"):
+        with pytest.raises(SystemExit):
+            cli(args=[], prog_name="test_repl_ctx_history_batch")
+
+    assert capsys.readouterr().out.replace("\r\n", "\n") == (
+        "Hello!\nHello!\n[['history-batch-test', 'hello'], ['hello']]\n"
+    )
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_repl_ctx_history_batch_invalid_size(n):
+    repl_ctx = ReplContext(click.Context(cli), {})
+
+    with pytest.raises(ValueError, match="at least 1"):
+        repl_ctx.history_batch(n)
+
+
 @cli.command()
 @click_repl.pass_context
 def prompt_test(repl_ctx):
@@ -48,3 +77,69 @@ def test_repl_ctx_prompt(capsys):
             cli(args=[], prog_name="test_repl_ctx_history")
 
     assert capsys.readouterr().out.replace("\r\n", "\n") == "None\n"
+
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def bounded_cli(ctx):
+    if ctx.invoked_subcommand is None:
+        click_repl.repl(ctx, max_history=2)
+
+
+bounded_cli.add_command(hello)
+bounded_cli.add_command(history_test)
+
+
+def test_repl_ctx_max_history(capsys):
+    with mock_stdin("hello\nhello\nhello\nhistory-test\n"):
+        with pytest.raises(SystemExit):
+            bounded_cli(args=[], prog_name="test_repl_ctx_max_history")
+
+    assert capsys.readouterr().out.replace("\r\n", "\n") == (
+        "Hello!\nHello!\nHello!\n['history-test', 'hello']\n"
+    )
+
+
+def test_repl_ctx_info_dict_does_not_create_session(monkeypatch):
+    from click_repl import globals_
+
+    monkeypatch.setattr(globals_, "_isatty", True)
+
+    repl_ctx = ReplContext(click.Context(cli), {})
+    assert repl_ctx.to_info_dict()["session"] is None
+    assert repl_ctx._session is None
+
+
+class CountingHistory(InMemoryHistory):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.load_count = 0
+
+    def load_history_strings(self):
+        self.load_count += 1
+        return super().load_history_strings()
+
+
+def test_repl_ctx_history_reads_loaded_strings(monkeypatch):
+    from click_repl import globals_
+
+    monkeypatch.setattr(globals_, "_isatty", True)
+
+    history = CountingHistory(["foo", "bar"])
+    repl_ctx = ReplContext(
+        click.Context(cli), {"history": history, "output": DummyOutput()}
+    )
+
+    # Not loaded by the session yet, so it's read from the history's storage.
+    assert list(repl_ctx.history()) == ["bar", "foo"]
+    assert history.load_count == 1
+
+    async def load():
+        return [item async for item in history.load()]
+
+    asyncio.run(load())
+    history.append_string("baz")
+
+    assert list(repl_ctx.history()) == ["baz", "bar", "foo"]
+    assert list(repl_ctx.history_batch(2)) == [["baz", "bar"], ["foo"]]
+    assert history.load_count == 2
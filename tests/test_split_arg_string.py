@@ -0,0 +1,68 @@
+import shlex
+
+import pytest
+
+from click_repl.utils import split_arg_string
+
+
+def shlex_split_arg_string(string, posix=True):
+    lex = shlex.shlex(string, posix=posix)
+    lex.whitespace_split = True
+    lex.commenters = ""
+    out = []
+
+    try:
+        for token in lex:
+            out.append(token)
+    except ValueError:
+        out.append(lex.token)
+
+    return out
+
+
+@pytest.mark.parametrize(
+    "test_input, expected",
+    [
+        ("", []),
+        ("example 'my file", ["example", "my file"]),
+        ("example my\\", ["example", "my"]),
+        ("cmd --opt=val  arg", ["cmd", "--opt=val", "arg"]),
+        ('cmd "a \\"quoted\\" \\n word"', ["cmd", 'a "quoted" \\n word']),
+        ("cmd a'b c'd", ["cmd", "ab cd"]),
+        ("cmd '' \"\"", ["cmd", "", ""]),
+        ("cmd \\", ["cmd", ""]),
+    ],
+)
+def test_split_arg_string(test_input, expected):
+    assert split_arg_string(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    "test_input, expected",
+    [
+        ("example 'my file", ["example", "'my file"]),
+        ("example 'my file'", ["example", "'my file'"]),
+        ("cmd a'b c'd", ["cmd", "a'b", "c'd"]),
+        ("cmd 'a'b", ["cmd", "'a'", "b"]),
+        ("cmd my\\ file", ["cmd", "my\\", "file"]),
+    ],
+)
+def test_split_arg_string_non_posix(test_input, expected):
+    assert split_arg_string(test_input, posix=False) == expected
+
+
+@pytest.mark.parametrize("posix", [True, False])
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        "a\tb\nc\rd e\x0bf",
+        "'a \"b\" c' \"d 'e' f\"",
+        "a\\ b \\'c\\' \"d\\\\e\"",
+        "\"unclosed \\",
+        "x='y z' --flag \"\" ''",
+    ],
+)
+def test_split_arg_string_matches_shlex(test_input, posix):
+    assert split_arg_string(test_input, posix) == shlex_split_arg_string(
+        test_input, posix
+    )